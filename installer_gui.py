@@ -6,19 +6,116 @@ A comprehensive installation wizard with modern GUI interface
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk
+import collections
 import os
+import queue
 import sys
 import threading
-import time
 import shutil
 import subprocess
-import json
 import platform
-from pathlib import Path
-import webbrowser
+
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Locations that need administrator privileges to write to
+_ADMIN_PREFIXES_WIN = tuple(p.upper() for p in (
+    "C:\\Program Files",
+    "C:\\Program Files (x86)",
+    "C:\\Windows",
+    "C:\\ProgramData"
+))
+_ADMIN_PREFIXES_NIX = ("/usr", "/opt", "/etc", "/var", "/bin", "/sbin")
+
+_WELCOME_TEXT = """This wizard will guide you through the installation of Minecraft Server Wrapper.
+
+Minecraft Server Wrapper is a comprehensive web-based management tool for Minecraft servers that provides:
+
+• Easy server management with start/stop/restart controls
+• Real-time console monitoring and command execution
+• File manager with upload/download capabilities
+• System monitoring with CPU, RAM, and network graphs
+• Cross-platform compatibility (Windows/Linux)
+• Modern web interface accessible from any browser
+
+Click Next to continue with the installation."""
+
+_LICENSE_TEXT = """MIT License
+
+Copyright (c) 2024 Minecraft Server Wrapper
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+By installing this software, you agree to the terms and conditions outlined above.
+This software is provided for educational and personal use. Commercial use is
+permitted under the terms of this license.
+
+Additional Terms:
+- This software may collect anonymous usage statistics to improve functionality
+- No personal data is transmitted without explicit user consent
+- The software may check for updates automatically
+- Third-party components may have their own license terms"""
+
+# A wizard step: its display name and the method that builds its frame
+Step = collections.namedtuple('Step', 'name build')
+
+# Files installed by the wizard as (source, destination relative to the install path)
+_FILES_TO_COPY = tuple((f, f) for f in (
+    'server.js', 'package.json', 'package-lock.json', 'setup.js',
+    'install.bat', 'install.sh', 'uninstall.bat', 'README.md',
+    'public/index.html', 'public/script.js', 'public/style.css'
+))
+
+# Directories created inside the install path
+_DIR_STRUCTURE = ('public', 'minecraft-server')
+
+# Number of concurrent file copies during installation (copying is I/O-bound)
+COPY_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+# Scripts whose permission bits and timestamps must survive the copy
+SCRIPT_EXTENSIONS = ('.bat', '.sh')
+
+def copy_install_file(src, dst):
+    """Copy a single file using the fastest copy path the OS offers"""
+    # shutil.copyfile already uses sendfile() on Linux; on Windows let CopyFileExW
+    # handle prefetching itself
+    if _IS_WINDOWS:
+        try:
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+                return
+        except (ImportError, AttributeError, OSError):
+            pass
+    shutil.copyfile(src, dst)
+    # Metadata only matters for scripts, which need their execute bit
+    if src.endswith(SCRIPT_EXTENSIONS):
+        shutil.copystat(src, dst)
 
 class InstallerWizard:
+    # Default installation path, resolved once for the process
+    if _IS_WINDOWS:
+        # Use user's AppData\Local for default installation to avoid permission issues
+        DEFAULT_INSTALL_PATH = os.path.join(os.path.expandvars("%LOCALAPPDATA%"), "MinecraftServerWrapper")
+    else:
+        # Use user's home directory for Linux
+        DEFAULT_INSTALL_PATH = os.path.expanduser("~/minecraft-server-wrapper")
+        
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Minecraft Server Wrapper - Installation Wizard")
@@ -34,7 +131,7 @@ class InstallerWizard:
         self.app_description = "Web-based Minecraft Server Management Tool"
         
         # Installation configuration
-        self.install_path = self.get_default_install_path()
+        self.install_path = self.DEFAULT_INSTALL_PATH
         self.license_accepted = tk.BooleanVar()
         self.components = {
             'core': {'name': 'Core Application', 'selected': tk.BooleanVar(value=True), 'required': True, 'size': '15 MB'},
@@ -45,18 +142,22 @@ class InstallerWizard:
         
         # Wizard state
         self.current_step = 0
-        self.steps = [
-            {'name': 'Welcome', 'function': self.create_welcome_screen},
-            {'name': 'License', 'function': self.create_license_screen},
-            {'name': 'Directory', 'function': self.create_directory_screen},
-            {'name': 'Components', 'function': self.create_components_screen},
-            {'name': 'Installation', 'function': self.create_installation_screen},
-            {'name': 'Complete', 'function': self.create_completion_screen}
-        ]
+        self.steps = (
+            Step('Welcome', self.create_welcome_screen),
+            Step('License', self.create_license_screen),
+            Step('Directory', self.create_directory_screen),
+            Step('Components', self.create_components_screen),
+            Step('Installation', self.create_installation_screen),
+            Step('Complete', self.create_completion_screen)
+        )
+        self._step_frames = [None] * len(self.steps)
         
         # Installation state
-        self.installation_cancelled = False
         self.installation_complete = False
+        self._validate_job = None
+        self._progress_q = queue.Queue()
+        self._loop = None
+        self._install_task = None
         self.launch_app = tk.BooleanVar(value=True)
         self.view_readme = tk.BooleanVar(value=False)
         
@@ -74,16 +175,6 @@ class InstallerWizard:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
         
-    def get_default_install_path(self):
-        """Get the default installation path based on the operating system"""
-        if platform.system() == "Windows":
-            # Use user's AppData\Local for default installation to avoid permission issues
-            user_local = os.path.expandvars("%LOCALAPPDATA%")
-            return os.path.join(user_local, "MinecraftServerWrapper")
-        else:
-            # Use user's home directory for Linux
-            return os.path.expanduser("~/minecraft-server-wrapper")
-            
     def setup_styles(self):
         """Configure modern styling for the application"""
         style = ttk.Style()
@@ -96,22 +187,26 @@ class InstallerWizard:
         accent_color = '#0078d4'
         text_color = '#323130'
         
-        # Configure styles
-        style.configure('Title.TLabel', font=('Segoe UI', 16, 'bold'), foreground=accent_color)
-        style.configure('Subtitle.TLabel', font=('Segoe UI', 10), foreground=text_color)
-        style.configure('Header.TLabel', font=('Segoe UI', 12, 'bold'), foreground=text_color)
-        style.configure('Modern.TButton', font=('Segoe UI', 9))
-        style.configure('Accent.TButton', font=('Segoe UI', 9, 'bold'))
+        # Configure styles in a single theme update
+        style.theme_settings('clam', {
+            'Title.TLabel': {'configure': {'font': ('Segoe UI', 16, 'bold'), 'foreground': accent_color}},
+            'Subtitle.TLabel': {'configure': {'font': ('Segoe UI', 10), 'foreground': text_color}},
+            'Header.TLabel': {'configure': {'font': ('Segoe UI', 12, 'bold'), 'foreground': text_color}},
+            'Modern.TButton': {'configure': {'font': ('Segoe UI', 9)}},
+            'Accent.TButton': {'configure': {'font': ('Segoe UI', 9, 'bold')}}
+        })
         
         # Configure root background
         self.root.configure(bg=bg_color)
         
     def create_main_layout(self):
         """Create the main layout structure"""
+        # The window is a fixed 800x600, so the top-level frames are placed at fixed
+        # positions instead of going through the packer's size negotiation
+        
         # Header frame
-        self.header_frame = tk.Frame(self.root, bg='white', height=80)
-        self.header_frame.pack(fill='x', padx=0, pady=0)
-        self.header_frame.pack_propagate(False)
+        self.header_frame = tk.Frame(self.root, bg='white')
+        self.header_frame.place(x=0, y=0, width=800, height=80)
         
         # Header content
         header_content = tk.Frame(self.header_frame, bg='white')
@@ -136,12 +231,11 @@ class InstallerWizard:
         
         # Main content frame
         self.content_frame = tk.Frame(self.root, bg='#f0f0f0')
-        self.content_frame.pack(expand=True, fill='both', padx=20, pady=20)
+        self.content_frame.place(x=20, y=100, width=760, height=420)
         
         # Button frame
-        self.button_frame = tk.Frame(self.root, bg='#f0f0f0', height=60)
-        self.button_frame.pack(fill='x', padx=20, pady=(0, 20))
-        self.button_frame.pack_propagate(False)
+        self.button_frame = tk.Frame(self.root, bg='#f0f0f0')
+        self.button_frame.place(x=20, y=520, width=760, height=60)
         
         # Navigation buttons
         self.cancel_button = ttk.Button(self.button_frame, text="Cancel", command=self.cancel_installation)
@@ -155,23 +249,33 @@ class InstallerWizard:
         
     def update_step_indicator(self):
         """Update the step indicator in the header"""
-        current_step_name = self.steps[self.current_step]['name']
+        current_step_name = self.steps[self.current_step].name
         step_text = f"Step {self.current_step + 1} of {len(self.steps)}: {current_step_name}"
         self.step_label.config(text=step_text)
         
     def show_current_step(self):
         """Display the current step"""
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Hide the previous step; its frame is kept to be reused on Back/Next
+        for step_frame in self._step_frames:
+            if step_frame is not None:
+                step_frame.pack_forget()
             
         # Update step indicator
         self.update_step_indicator()
         
-        # Show current step
-        current_frame = self.steps[self.current_step]['function']()
-        current_frame.pack(expand=True, fill='both')
-        
+        # Show current step, building its frame on first visit
+        if self._step_frames[self.current_step] is None:
+            self._step_frames[self.current_step] = self.steps[self.current_step].build()
+        self._step_frames[self.current_step].pack(expand=True, fill='both')
+        
+        # Start installation in background each time its screen is entered, unless
+        # it is already running or done
+        if (self.current_step == 4 and not self.installation_complete
+                and (self._install_task is None or self._install_task.done())):
+            self.progress_var.set(0)
+            self.status_label.config(text="Preparing installation...")
+            self.root.after_idle(self.perform_installation)
+            
         # Update button states
         self.update_button_states()
         
@@ -217,13 +321,13 @@ class InstallerWizard:
             
     def cancel_installation(self):
         """Cancel the installation"""
-        if self.current_step == 4 and not self.installation_complete:  # During installation
-            self.installation_cancelled = True
-            
+        from tkinter import messagebox
         result = messagebox.askyesno("Cancel Installation", 
                                    "Are you sure you want to cancel the installation?",
                                    icon='question')
         if result:
+            if self._install_task is not None:
+                self._install_task.cancel()
             self.root.quit()
             
     def start_installation(self):
@@ -233,6 +337,7 @@ class InstallerWizard:
         
     def finish_installation(self):
         """Finish the installation and close the wizard"""
+        from tkinter import messagebox
         if self.launch_app.get():
             self.launch_application()
             
@@ -246,15 +351,19 @@ class InstallerWizard:
     def launch_application(self):
         """Launch the installed application"""
         try:
-            if platform.system() == "Windows":
+            # Launch the script directly rather than through cmd.exe or /bin/sh
+            if _IS_WINDOWS:
                 start_script = os.path.join(self.install_path, "start.bat")
                 if os.path.exists(start_script):
-                    subprocess.Popen([start_script], shell=True)
+                    os.startfile(start_script)
             else:
                 start_script = os.path.join(self.install_path, "start.sh")
                 if os.path.exists(start_script):
-                    subprocess.Popen([start_script], shell=True)
+                    os.chmod(start_script, 0o755)
+                    # Detach so closing the installer doesn't take the application with it
+                    subprocess.Popen([start_script], start_new_session=True)
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Launch Error", f"Could not launch the application: {str(e)}")
             
     def open_readme(self):
@@ -262,11 +371,12 @@ class InstallerWizard:
         try:
             readme_path = os.path.join(self.install_path, "README.md")
             if os.path.exists(readme_path):
-                if platform.system() == "Windows":
+                if _IS_WINDOWS:
                     os.startfile(readme_path)
                 else:
                     subprocess.Popen(['xdg-open', readme_path])
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Could not open README: {str(e)}")
             
     def run(self):
@@ -293,28 +403,9 @@ class InstallerWizard:
         icon_frame.pack_propagate(False)
         
         # Welcome message
-        welcome_text = """This wizard will guide you through the installation of Minecraft Server Wrapper.
-
-Minecraft Server Wrapper is a comprehensive web-based management tool for Minecraft servers that provides:
-
-• Easy server management with start/stop/restart controls
-• Real-time console monitoring and command execution
-• File manager with upload/download capabilities
-• System monitoring with CPU, RAM, and network graphs
-• Cross-platform compatibility (Windows/Linux)
-• Modern web interface accessible from any browser
-
-Click Next to continue with the installation."""
-        
-        text_widget = tk.Text(frame, wrap=tk.WORD, height=12, width=60, 
-                             font=('Segoe UI', 10), relief='flat', 
-                             bg=self.root.cget('bg'), state='disabled')
-        text_widget.pack(pady=20, padx=20, fill='both', expand=True)
-        
-        # Enable text widget to insert content
-        text_widget.config(state='normal')
-        text_widget.insert('1.0', welcome_text)
-        text_widget.config(state='disabled')
+        welcome_label = ttk.Label(frame, text=_WELCOME_TEXT, wraplength=560, justify='left',
+                                  anchor='nw', font=('Segoe UI', 10))
+        welcome_label.pack(pady=20, padx=20, fill='both', expand=True)
         
         return frame
 
@@ -326,63 +417,32 @@ Click Next to continue with the installation."""
         title_label = ttk.Label(frame, text="License Agreement", style='Header.TLabel')
         title_label.pack(pady=(10, 20))
         
-        # License text
-        license_text = """MIT License
-
-Copyright (c) 2024 Minecraft Server Wrapper
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-
-By installing this software, you agree to the terms and conditions outlined above.
-This software is provided for educational and personal use. Commercial use is
-permitted under the terms of this license.
-
-Additional Terms:
-- This software may collect anonymous usage statistics to improve functionality
-- No personal data is transmitted without explicit user consent
-- The software may check for updates automatically
-- Third-party components may have their own license terms"""
-        
-        # Scrollable text area
+        # Scrollable license text area
         text_frame = tk.Frame(frame)
         text_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
         scrollbar = tk.Scrollbar(text_frame)
         scrollbar.pack(side='right', fill='y')
         
-        text_widget = tk.Text(text_frame, wrap=tk.WORD, font=('Segoe UI', 9),
-                             yscrollcommand=scrollbar.set, height=15)
-        text_widget.pack(side='left', fill='both', expand=True)
-        scrollbar.config(command=text_widget.yview)
+        # The license never changes, so it is drawn once as a single canvas text item
+        canvas = tk.Canvas(text_frame, bg='white', height=240, highlightthickness=0,
+                           yscrollcommand=scrollbar.set)
+        canvas.pack(side='left', fill='both', expand=True)
+        canvas.create_text(5, 5, anchor='nw', text=_LICENSE_TEXT, font=('Segoe UI', 9), width=680)
+        canvas.config(scrollregion=canvas.bbox('all'))
+        scrollbar.config(command=canvas.yview)
         
-        text_widget.insert('1.0', license_text)
-        text_widget.config(state='disabled')
+        # Canvas has no built-in wheel scrolling, unlike Text
+        canvas.bind('<MouseWheel>', lambda e: canvas.yview_scroll(-e.delta // 120, 'units'))
+        canvas.bind('<Button-4>', lambda e: canvas.yview_scroll(-1, 'units'))
+        canvas.bind('<Button-5>', lambda e: canvas.yview_scroll(1, 'units'))
         
         # Acceptance checkbox
-        accept_frame = tk.Frame(frame)
-        accept_frame.pack(pady=20)
-        
-        accept_checkbox = ttk.Checkbutton(accept_frame, 
+        accept_checkbox = ttk.Checkbutton(frame, 
                                          text="I accept the terms of the License Agreement",
                                          variable=self.license_accepted,
                                          command=self.check_next_button_state)
-        accept_checkbox.pack()
+        accept_checkbox.pack(pady=20)
         
         return frame
 
@@ -398,105 +458,121 @@ Additional Terms:
         desc_label = ttk.Label(frame, text="Select the folder where you want to install Minecraft Server Wrapper:")
         desc_label.pack(pady=(0, 20))
         
-        # Directory selection
-        dir_frame = tk.Frame(frame)
-        dir_frame.pack(fill='x', padx=40, pady=10)
-        
-        ttk.Label(dir_frame, text="Installation Directory:").pack(anchor='w', pady=(0, 5))
+        # Directory selection, space requirements and warning share one grid
+        grid_frame = ttk.Frame(frame)
+        grid_frame.pack(fill='x', padx=40)
+        grid_frame.columnconfigure(0, weight=1)
         
-        path_frame = tk.Frame(dir_frame)
-        path_frame.pack(fill='x')
+        ttk.Label(grid_frame, text="Installation Directory:").grid(row=0, column=0, columnspan=2, sticky='w',
+                                                                  pady=(10, 5))
         
         self.path_var = tk.StringVar(value=self.install_path)
-        path_entry = ttk.Entry(path_frame, textvariable=self.path_var, font=('Segoe UI', 10))
-        path_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
+        self.path_entry = ttk.Entry(grid_frame, textvariable=self.path_var, font=('Segoe UI', 10))
+        self.path_entry.grid(row=1, column=0, sticky='we', padx=(0, 10))
         
-        browse_button = ttk.Button(path_frame, text="Browse...", command=self.browse_directory)
-        browse_button.pack(side='right')
+        self.browse_button = ttk.Button(grid_frame, text="Browse...", command=self.browse_directory)
+        self.browse_button.grid(row=1, column=1, sticky='e')
         
         # Space requirements
-        space_frame = tk.Frame(frame)
-        space_frame.pack(fill='x', padx=40, pady=20)
-        
-        ttk.Label(space_frame, text="Space Requirements:", font=('Segoe UI', 10, 'bold')).pack(anchor='w')
-        ttk.Label(space_frame, text="• Required space: 25 MB").pack(anchor='w', padx=(20, 0))
-        ttk.Label(space_frame, text="• Available space: Checking...").pack(anchor='w', padx=(20, 0))
+        ttk.Label(grid_frame, text="Space Requirements:", font=('Segoe UI', 10, 'bold')).grid(
+            row=2, column=0, columnspan=2, sticky='w', pady=(30, 0))
+        ttk.Label(grid_frame, text="• Required space: 25 MB").grid(row=3, column=0, columnspan=2, sticky='w',
+                                                                   padx=(20, 0))
+        ttk.Label(grid_frame, text="• Available space: Checking...").grid(row=4, column=0, columnspan=2,
+                                                                          sticky='w', padx=(20, 0))
         
         # Permission warning for Program Files
-        warning_frame = tk.Frame(frame)
-        warning_frame.pack(fill='x', padx=40, pady=10)
-        
-        warning_text = ttk.Label(warning_frame, 
+        warning_text = ttk.Label(grid_frame, 
                                text="⚠ Note: Installing to Program Files or system directories requires administrator privileges.\n"
                                     "For easier installation, consider using the default user directory.",
                                font=('Segoe UI', 9), foreground='#FF8C00', wraplength=500)
-        warning_text.pack(anchor='w')
+        warning_text.grid(row=5, column=0, columnspan=2, sticky='w', pady=(30, 10))
         
         # Validation info
         self.validation_label = ttk.Label(frame, text="", foreground='green')
         self.validation_label.pack(pady=10)
         
-        # Validate initial path
-        self.validate_directory()
+        # Revalidate whenever the path changes, starting with the initial one
+        self.path_var.trace_add('write', self.on_path_changed)
+        self.schedule_validation()
         
         return frame
         
+    def set_path_locked(self, locked):
+        """Enable or disable changing the installation directory"""
+        state = 'disabled' if locked else 'normal'
+        self.path_entry.config(state=state)
+        self.browse_button.config(state=state)
+        
     def browse_directory(self):
         """Open directory browser"""
+        from tkinter import filedialog
         directory = filedialog.askdirectory(initialdir=self.path_var.get())
         if directory:
             self.path_var.set(directory)
-            self.install_path = directory
-            self.validate_directory()
             
+    def on_path_changed(self, *args):
+        """Track edits to the installation path entry"""
+        self.install_path = self.path_var.get()
+        self.schedule_validation()
+        
+    def schedule_validation(self):
+        """Validate the selected directory once typing has paused for 250 ms"""
+        if self._validate_job:
+            self.root.after_cancel(self._validate_job)
+        self._validate_job = self.root.after(250, self.validate_directory)
+        
     def validate_directory(self):
-        """Validate the selected directory"""
+        """Validate the selected directory in the background"""
+        self._validate_job = None
         path = self.path_var.get()
+        
+        # os.access() can block for seconds on network drives, keep it off the Tk thread.
+        # The worker only fills result_q; the Tk thread polls it for the result
+        result_q = queue.Queue()
+        threading.Thread(target=lambda: result_q.put(self.check_directory(path)), daemon=True).start()
+        self.root.after(50, self._poll_validation, path, result_q)
+        
+    def _poll_validation(self, path, result_q):
+        """Apply the validation result for path once the worker has queued it"""
+        try:
+            text, color = result_q.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_validation, path, result_q)
+            return
+        self.apply_validation_result(path, text, color)
+        
+    def apply_validation_result(self, path, text, color):
+        """Show a validation result unless the path has changed since"""
+        if path == self.path_var.get():
+            self.validation_label.config(text=text, foreground=color)
+            
+    def check_directory(self, path):
+        """Check whether the directory can be installed to, returning (message, color)"""
         try:
             # Check if path exists or can be created
             if not os.path.exists(path):
                 parent = os.path.dirname(path)
                 if os.path.exists(parent) and os.access(parent, os.W_OK):
-                    self.validation_label.config(text="✓ Directory will be created", foreground='green')
-                    return True
-                else:
-                    # Check if we need admin privileges for this path
-                    if self.is_admin_required_path(path):
-                        self.validation_label.config(text="⚠ Administrator privileges required for this location", foreground='orange')
-                        return False
-                    else:
-                        self.validation_label.config(text="✗ Cannot create directory", foreground='red')
-                        return False
-            elif os.access(path, os.W_OK):
-                self.validation_label.config(text="✓ Directory is writable", foreground='green')
-                return True
-            else:
+                    return "✓ Directory will be created", 'green'
                 # Check if we need admin privileges for this path
                 if self.is_admin_required_path(path):
-                    self.validation_label.config(text="⚠ Administrator privileges required for this location", foreground='orange')
-                    return False
-                else:
-                    self.validation_label.config(text="✗ Directory is not writable", foreground='red')
-                    return False
+                    return "⚠ Administrator privileges required for this location", 'orange'
+                return "✗ Cannot create directory", 'red'
+            elif os.access(path, os.W_OK):
+                return "✓ Directory is writable", 'green'
+            # Check if we need admin privileges for this path
+            if self.is_admin_required_path(path):
+                return "⚠ Administrator privileges required for this location", 'orange'
+            return "✗ Directory is not writable", 'red'
         except Exception as e:
-            self.validation_label.config(text=f"✗ Error: {str(e)}", foreground='red')
-            return False
+            return f"✗ Error: {str(e)}", 'red'
             
     def is_admin_required_path(self, path):
         """Check if the path requires administrator privileges"""
-        if platform.system() == "Windows":
-            admin_paths = [
-                "C:\\Program Files",
-                "C:\\Program Files (x86)",
-                "C:\\Windows",
-                "C:\\ProgramData"
-            ]
-            path_upper = path.upper()
-            return any(path_upper.startswith(admin_path.upper()) for admin_path in admin_paths)
-        else:
-            # For Linux, check if it's in system directories
-            system_paths = ["/usr", "/opt", "/etc", "/var", "/bin", "/sbin"]
-            return any(path.startswith(sys_path) for sys_path in system_paths)
+        if _IS_WINDOWS:
+            return path.upper().startswith(_ADMIN_PREFIXES_WIN)
+        return path.startswith(_ADMIN_PREFIXES_NIX)
 
     def create_components_screen(self):
         """Create the components selection screen"""
@@ -510,33 +586,25 @@ Additional Terms:
         desc_label = ttk.Label(frame, text="Choose which components you want to install:")
         desc_label.pack(pady=(0, 20))
         
-        # Components list
-        components_frame = tk.Frame(frame)
-        components_frame.pack(fill='both', expand=True, padx=40)
+        # Components list, rendered natively by a single Treeview
+        self.components_tree = ttk.Treeview(frame, columns=('size',), show='tree headings',
+                                            height=len(self.components), selectmode='none')
+        self.components_tree.heading('#0', text='Component', anchor='w')
+        self.components_tree.heading('size', text='Size', anchor='w')
+        self.components_tree.column('size', width=150, stretch=False)
+        self.components_tree.tag_configure('required', foreground='#666666')
+        self.components_tree.pack(fill='both', expand=True, padx=40)
         
         for comp_id, comp_info in self.components.items():
-            comp_frame = tk.Frame(components_frame)
-            comp_frame.pack(fill='x', pady=5)
-            
-            # Checkbox
-            checkbox = ttk.Checkbutton(comp_frame, 
-                                      variable=comp_info['selected'],
-                                      state='disabled' if comp_info['required'] else 'normal')
-            checkbox.pack(side='left', padx=(0, 10))
-            
-            # Component info
-            info_frame = tk.Frame(comp_frame)
-            info_frame.pack(side='left', fill='x', expand=True)
-            
-            name_label = ttk.Label(info_frame, text=comp_info['name'], font=('Segoe UI', 10, 'bold'))
-            name_label.pack(anchor='w')
-            
             size_text = comp_info['size']
             if comp_info['required']:
                 size_text += " (Required)"
                 
-            size_label = ttk.Label(info_frame, text=size_text, font=('Segoe UI', 9))
-            size_label.pack(anchor='w')
+            self.components_tree.insert('', 'end', iid=comp_id, text=self.component_label(comp_id),
+                                        values=(size_text,),
+                                        tags=('required',) if comp_info['required'] else ())
+            
+        self.components_tree.bind('<Button-1>', self.toggle_component)
         
         # Total size
         total_frame = tk.Frame(frame)
@@ -550,6 +618,21 @@ Additional Terms:
         
         return frame
 
+    def component_label(self, comp_id):
+        """Return the tree label for a component, prefixed with its check state"""
+        comp_info = self.components[comp_id]
+        mark = '☑' if comp_info['selected'].get() else '☐'
+        return f"{mark} {comp_info['name']}"
+        
+    def toggle_component(self, event):
+        """Toggle an optional component when its row is clicked"""
+        comp_id = self.components_tree.identify_row(event.y)
+        if not comp_id or self.components[comp_id]['required']:
+            return
+        selected = self.components[comp_id]['selected']
+        selected.set(not selected.get())
+        self.components_tree.item(comp_id, text=self.component_label(comp_id))
+        
     def create_installation_screen(self):
         """Create the installation progress screen"""
         frame = ttk.Frame(self.content_frame)
@@ -573,105 +656,141 @@ Additional Terms:
         self.time_label = ttk.Label(frame, text="", font=('Segoe UI', 9))
         self.time_label.pack(pady=5)
         
-        # Start installation in background
-        self.root.after(1000, self.perform_installation)
-        
         return frame
         
     def perform_installation(self):
-        """Perform the actual installation"""
-        def install_thread():
+        """Perform the actual installation on the background event loop"""
+        import asyncio
+        
+        # Files go into this directory from now on; cached screens such as Complete
+        # describe it, so it can only change again if the installation fails
+        self.set_path_locked(True)
+        
+        if self._loop is None:
+            # One event loop thread serves every installation attempt; file copies
+            # run in its default executor via asyncio.to_thread
+            import concurrent.futures
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=COPY_WORKERS))
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+            
+        self._install_task = asyncio.run_coroutine_threadsafe(self.install_files(), self._loop)
+        self.root.after(50, self._drain_progress)
+        
+    async def install_files(self):
+        """Copy the application files, returning a (callback, *args) outcome for the Tk thread"""
+        # This runs on the event loop thread, so Tk is only touched by _drain_progress
+        import asyncio
+        
+        try:
+            # Create installation directory with proper error handling
             try:
-                files_to_copy = [
-                    'server.js', 'package.json', 'package-lock.json', 'setup.js', 
-                    'install.bat', 'install.sh', 'uninstall.bat', 'README.md'
-                ]
-                
-                # Add public directory files
-                public_files = ['public/index.html', 'public/script.js', 'public/style.css']
-                files_to_copy.extend(public_files)
-                
-                total_files = len(files_to_copy)
+                os.makedirs(self.install_path, exist_ok=True)
                 
-                # Create installation directory with proper error handling
-                try:
-                    os.makedirs(self.install_path, exist_ok=True)
-                    
-                    # Test write permissions by creating a temporary file
-                    test_file = os.path.join(self.install_path, '.test_write')
-                    with open(test_file, 'w') as f:
-                        f.write('test')
-                    os.remove(test_file)
-                    
-                except PermissionError as e:
-                    error_msg = f"Access denied to installation directory.\n\n"
-                    if self.is_admin_required_path(self.install_path):
-                        error_msg += "This location requires administrator privileges.\n\n"
-                        error_msg += "Solutions:\n"
-                        error_msg += "1. Run the installer as Administrator (right-click → Run as administrator)\n"
-                        error_msg += "2. Choose a different installation directory (e.g., your user folder)\n"
-                        error_msg += f"3. Use the default location: {self.get_default_install_path()}"
-                    else:
-                        error_msg += f"Please check folder permissions or choose a different location."
-                    
-                    self.root.after(0, lambda: self.show_permission_error(error_msg))
-                    return
-                except Exception as e:
-                    self.root.after(0, lambda: self.show_installation_error(f"Failed to create installation directory: {str(e)}"))
-                    return
-                
-                # Create public subdirectory
-                public_dir = os.path.join(self.install_path, 'public')
-                os.makedirs(public_dir, exist_ok=True)
-                
-                for i, filename in enumerate(files_to_copy):
-                    if self.installation_cancelled:
-                        return
-                        
-                    # Update UI
-                    progress = (i / total_files) * 100
-                    self.progress_var.set(progress)
-                    self.status_label.config(text=f"Installing files... ({i+1}/{total_files})")
-                    self.file_label.config(text=f"Copying: {filename}")
-                    
-                    # Copy file if it exists
-                    if os.path.exists(filename):
-                        dest_path = os.path.join(self.install_path, filename)
-                        dest_dir = os.path.dirname(dest_path)
-                        os.makedirs(dest_dir, exist_ok=True)
-                        shutil.copy2(filename, dest_path)
-                    
-                    time.sleep(0.2)  # Simulate installation time
-                
-                # Create minecraft-server directory
-                minecraft_dir = os.path.join(self.install_path, 'minecraft-server')
-                os.makedirs(minecraft_dir, exist_ok=True)
-                
-                # Final steps
-                self.progress_var.set(100)
-                self.status_label.config(text="Installation completed successfully!")
-                self.file_label.config(text="")
-                self.time_label.config(text="")
+                # Test write permissions by creating a temporary file
+                test_file = os.path.join(self.install_path, '.test_write')
+                with open(test_file, 'w') as f:
+                    f.write('test')
+                os.remove(test_file)
                 
-                self.installation_complete = True
-                self.root.after(0, self.check_next_button_state)
+            except PermissionError as e:
+                error_msg = f"Access denied to installation directory.\n\n"
+                if self.is_admin_required_path(self.install_path):
+                    error_msg += "This location requires administrator privileges.\n\n"
+                    error_msg += "Solutions:\n"
+                    error_msg += "1. Run the installer as Administrator (right-click → Run as administrator)\n"
+                    error_msg += "2. Choose a different installation directory (e.g., your user folder)\n"
+                    error_msg += f"3. Use the default location: {self.DEFAULT_INSTALL_PATH}"
+                else:
+                    error_msg += f"Please check folder permissions or choose a different location."
                 
+                return self.show_permission_error, error_msg
             except Exception as e:
-                error_msg = f"Installation failed: {str(e)}"
-                self.root.after(0, lambda: self.show_installation_error(error_msg))
+                return self.show_installation_error, f"Failed to create installation directory: {str(e)}"
+            
+            # Build the copy plan once, sizing each file so progress tracks bytes copied
+            copy_plan = []
+            for src, rel_dest in _FILES_TO_COPY:
+                try:
+                    size = os.stat(src).st_size
+                except FileNotFoundError:
+                    # Optional files missing from the source tree are skipped
+                    continue
+                copy_plan.append((src, os.path.join(self.install_path, rel_dest), size))
+            total_files = len(copy_plan)
+            total_bytes = sum(size for _, _, size in copy_plan) or 1
+            
+            # Create the installation directory structure
+            for rel_dir in _DIR_STRUCTURE:
+                os.makedirs(os.path.join(self.install_path, rel_dir), exist_ok=True)
+            
+            async def copy_file(src, dest, size):
+                await asyncio.to_thread(copy_install_file, src, dest)
+                return src, size
                 
-        threading.Thread(target=install_thread, daemon=True).start()
+            # Copy files concurrently; progress is picked up by _drain_progress
+            copies = [asyncio.ensure_future(copy_file(*entry)) for entry in copy_plan]
+            try:
+                copied_bytes = 0
+                for copied, next_copy in enumerate(asyncio.as_completed(copies), 1):
+                    filename, size = await next_copy
+                    copied_bytes += size
+                    self._progress_q.put(((copied_bytes / total_bytes) * 100,
+                                          f"Installing files... ({copied}/{total_files})",
+                                          f"Copied: {filename}"))
+            finally:
+                # Stop copies that have not started yet if we failed or were cancelled
+                for pending in copies:
+                    pending.cancel()
+            
+            # Final steps
+            self._progress_q.put((100, "Installation completed successfully!", ""))
+            
+            self.installation_complete = True
+            return self.check_next_button_state,
+            
+        except Exception as e:
+            return self.show_installation_error, f"Installation failed: {str(e)}"
+            
+    def _apply_latest_progress(self):
+        """Apply only the most recent queued progress update to the widgets"""
+        last = None
+        try:
+            while True:
+                last = self._progress_q.get_nowait()
+        except queue.Empty:
+            pass
+        if last:
+            progress, status, file_text = last
+            self.progress_var.set(progress)
+            self.status_label.config(text=status)
+            self.file_label.config(text=file_text)
+            
+    def _drain_progress(self):
+        """Flush queued progress updates every 50 ms while the installation runs"""
+        self._apply_latest_progress()
+        if not self._install_task.done() or not self._progress_q.empty():
+            self.root.after(50, self._drain_progress)
+        elif not self._install_task.cancelled():
+            # Act on the installation's outcome here, on the Tk thread
+            callback, *args = self._install_task.result()
+            callback(*args)
         
     def show_permission_error(self, message):
         """Show permission error dialog with helpful suggestions"""
+        from tkinter import messagebox
         messagebox.showerror("Permission Error", message)
+        self.set_path_locked(False)
         # Go back to directory selection
         self.current_step = 2  # Directory selection step
         self.show_current_step()
         
     def show_installation_error(self, message):
         """Show general installation error"""
+        from tkinter import messagebox
         messagebox.showerror("Installation Error", message)
+        self.set_path_locked(False)
+        self._apply_latest_progress()
         self.status_label.config(text="Installation failed. Please try again.")
         self.progress_var.set(0)
 
@@ -725,11 +844,10 @@ if __name__ == "__main__":
     if silent_mode:
         # Import and run silent installer
         try:
-            from silent_installer import SilentInstaller
+            from silent_installer import SilentInstaller, exit_after_install
             silent_installer = SilentInstaller()
             args = silent_installer.parse_arguments()
-            success = silent_installer.run_silent_installation(args)
-            sys.exit(0 if success else 1)
+            exit_after_install(silent_installer.run_silent_installation(args))
         except ImportError:
             print("Error: Silent installer module not found")
             sys.exit(1)
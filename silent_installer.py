@@ -5,15 +5,350 @@ Minecraft Server Wrapper - Silent Installation Module
 Handles unattended/silent installation mode
 """
 
+import functools
+import io
 import os
+import stat
 import sys
-import shutil
-import json
-import platform
-import argparse
-from pathlib import Path
+import threading
+import types
+
+@functools.lru_cache(maxsize=None)
+def _liburing():
+    """Import the optional liburing binding on first use, or return None if missing"""
+    try:
+        import liburing
+    except ImportError:
+        return None
+    return liburing
+
+@functools.lru_cache(maxsize=None)
+def _json_codec():
+    """Return (dumps, loads) working on bytes, importing the JSON backend on first use.
+    
+    orjson's C serializer is preferred when it is installed.
+    """
+    try:
+        import orjson
+        return (lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)), orjson.loads
+    except ImportError:
+        import json
+        return (lambda obj: json.dumps(obj, indent=2).encode()), json.loads
+
+def _dumps(obj):
+    return _json_codec()[0](obj)
+
+def _loads(data):
+    return _json_codec()[1](data)
+
+# Platform facts that don't change during a run
+_IS_WINDOWS = sys.platform.startswith('win')
+_HOME = os.path.expanduser('~')
+_DESKTOP = os.path.join(_HOME, 'Desktop')
+if _IS_WINDOWS:
+    _DEFAULT_INSTALL_PATH = os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Minecraft Server Wrapper')
+else:
+    _DEFAULT_INSTALL_PATH = os.path.join(_HOME, 'MinecraftWrapper')
+
+# Command line flags handled without argparse, mapped to their argument names
+_FLAGS = {
+    '--silent': 'silent', '-S': 'silent',
+    '--accept-license': 'accept_license', '-a': 'accept_license',
+    '--no-service': 'no_service',
+    '--no-shortcuts': 'no_shortcuts',
+    '--include-examples': 'include_examples',
+    '--verbose': 'verbose', '-v': 'verbose'
+}
+_VALUE_FLAGS = {
+    '--install-path': 'install_path', '-p': 'install_path',
+    '--config-file': 'config_file', '-c': 'config_file'
+}
+
+# Application files copied into the installation directory
+_FILES_TO_COPY = (
+    'app.js', 'package.json', 'script.js', 'index.html', 'style.css',
+    'install.bat', 'install.sh', 'setup.js', 'uninstall.bat', 'uninstall.sh',
+    'README.md'
+)
+
+# Installation steps as (description, SilentInstaller method name). _STEPS run
+# in order; _PARALLEL_STEPS only depend on the installed files and run together.
+# _FINAL_STEPS record a finished install, so they run once everything else succeeded
+_STEPS = (
+    ("Installing files", "install_files"),
+)
+_PARALLEL_STEPS = (
+    ("Creating shortcuts", "create_shortcuts"),
+    ("Preparing service installation", "install_service")
+)
+_FINAL_STEPS = (
+    ("Creating uninstaller", "create_uninstaller"),
+)
+
+# Chunk size for the buffered copy fallback, reused across files
+COPY_BUFSIZE = 1024 * 1024
+_BUF = bytearray(COPY_BUFSIZE)
+
+# Files must be opened in binary mode on Windows, where os.open defaults to text mode
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+# posix_fallocate()/posix_fadvise() are POSIX only (not on Windows or macOS)
+_HAS_FALLOCATE = hasattr(os, 'posix_fallocate')
+
+# Files up to this size are copied with a single read() and write()
+SMALL_FILE_SIZE = 64 * 1024
+
+def _write_all(fd, data):
+    """Write all of data to fd, continuing after short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _copy_with_stat(src, dst, st):
+    """Copy src to dst, applying the permissions and timestamps recorded in st"""
+    infd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        outfd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+        try:
+            if st.st_size <= SMALL_FILE_SIZE:
+                # Read one byte past the expected size so a file that grew is still copied whole
+                data = os.read(infd, st.st_size + 1)
+                _write_all(outfd, data)
+                if len(data) > st.st_size:
+                    _buffered_copy(infd, outfd)
+            else:
+                # copy_file_range() can clone extents on btrfs/XFS/NFS
+                _hint_large_copy(infd, outfd, st.st_size)
+                if not _kernel_copy(infd, outfd, st.st_size):
+                    _buffered_copy(infd, outfd)
+                if _HAS_FALLOCATE:
+                    # Drop any preallocated tail left over if src shrank while being copied
+                    os.ftruncate(outfd, os.lseek(outfd, 0, os.SEEK_CUR))
+                try:
+                    # The installed copy won't be read again soon; keep it out of the page cache
+                    os.posix_fadvise(outfd, 0, 0, os.POSIX_FADV_DONTNEED)
+                except (AttributeError, OSError):
+                    pass
+        finally:
+            os.close(outfd)
+    finally:
+        os.close(infd)
+    _apply_stat(dst, st)
+
+def _hint_large_copy(infd, outfd, size):
+    """Reserve size bytes for outfd in one extent and ask for readahead on infd"""
+    if _HAS_FALLOCATE and size:
+        try:
+            os.posix_fallocate(outfd, 0, size)
+        except OSError:
+            # EOPNOTSUPP on filesystems without preallocation; the copy grows the file instead
+            pass
+    try:
+        os.posix_fadvise(infd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass
+
+def _apply_stat(dst, st):
+    """Give dst the permissions and timestamps recorded in st"""
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+def _kernel_copy(infd, outfd, size):
+    """Copy in the kernel, returning False if fewer than size bytes were moved"""
+    # Some filesystems (FUSE, overlayfs, NFS) report 0 bytes for a non-empty file, so a
+    # short count means "try the next method"; each picks up at the current offsets
+    copied = 0
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while True:
+                n = os.copy_file_range(infd, outfd, 1 << 30)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            # ENOSYS/EXDEV/EINVAL etc.: try the next method
+            pass
+        if copied >= size:
+            return True
+    if sys.platform.startswith('linux'):
+        try:
+            while True:
+                n = os.sendfile(outfd, infd, None, COPY_BUFSIZE)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            pass
+        if copied >= size:
+            return True
+    return False
+
+def _buffered_copy(infd, outfd):
+    """Copy between file descriptors through the shared _BUF buffer"""
+    mv = memoryview(_BUF)
+    if hasattr(os, 'readv'):
+        while True:
+            n = os.readv(infd, [_BUF])
+            if not n:
+                break
+            _write_all(outfd, mv[:n])
+    else:
+        # No readv() on Windows; os.read allocates per chunk but works everywhere
+        while True:
+            data = os.read(infd, COPY_BUFSIZE)
+            if not data:
+                break
+            _write_all(outfd, data)
+
+# Largest file copied through a single io_uring read/write pair
+URING_MAX_FILE_SIZE = 16 * 1024 * 1024
+
+def _copy_files(jobs, dest_dev=None):
+    """Copy a batch of (src, dst, stat_result) jobs"""
+    # Every copy path truncates dst, so first fail like shutil.copy2 would
+    _check_not_same_files(jobs)
+    
+    if sys.platform.startswith('linux') and dest_dev is not None:
+        # Sources on the destination device can be reflinked without moving any data
+        cloned = []
+        for job in jobs:
+            if job[2].st_dev == dest_dev:
+                if not _try_clone(*job):
+                    # The filesystem can't clone (ext4, tmpfs, ...): copy the rest normally
+                    break
+                cloned.append(job)
+        # Filter rather than regroup so the remaining jobs keep their largest-first order
+        jobs = [job for job in jobs if job not in cloned]
+        
+    # Submit the remaining small files to the kernel at once, then copy the rest one by one
+    if sys.platform.startswith('linux') and _liburing() is not None:
+        batch = [job for job in jobs if 0 < job[2].st_size <= URING_MAX_FILE_SIZE]
+        if batch:
+            try:
+                failed = _uring_copy(batch)
+            except OSError:
+                # io_uring unavailable (ENOSYS, EPERM under seccomp, ...)
+                failed = batch
+            jobs = [job for job in jobs if job not in batch] + failed
+            
+    for src, dst, st in jobs:
+        _copy_with_stat(src, dst, st)
+
+def _check_not_same_files(jobs):
+    """Raise shutil.SameFileError if a job's destination already is its source"""
+    for src, dst, st in jobs:
+        try:
+            dst_st = os.stat(dst)
+        except FileNotFoundError:
+            continue
+        # DirEntry.stat() leaves st_dev/st_ino zero on Windows
+        src_st = st if st.st_ino else os.stat(src)
+        if (dst_st.st_dev, dst_st.st_ino) == (src_st.st_dev, src_st.st_ino):
+            import shutil
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+# ioctl request number of FICLONE from <linux/fs.h>
+FICLONE = 0x40049409
+
+def _try_clone(src, dst, st):
+    """Make dst a copy-on-write clone of src, returning False if unsupported"""
+    import fcntl
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    _apply_stat(dst, st)
+    return True
+
+def _uring_copy(jobs):
+    """Copy jobs with one io_uring submission, returning the jobs that did not complete"""
+    liburing = _liburing()
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(2 * len(jobs), ring)
+    fds = []
+    buffers = []
+    failed = set()
+    try:
+        for index, (src, dst, st) in enumerate(jobs):
+            infd = os.open(src, os.O_RDONLY)
+            fds.append(infd)
+            outfd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            fds.append(outfd)
+            # Read the whole file into one buffer, linked to a write of that buffer
+            buf = bytearray(st.st_size)
+            buffers.append(buf)
+            
+            # A short read breaks the link, cancelling the write
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, infd, buf, 0)
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, outfd, buf, 0)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+            
+        pending = 2 * len(jobs)
+        liburing.io_uring_submit_and_wait(ring, pending)
+        while pending:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            ready = liburing.io_uring_cq_ready(ring)
+            for i in range(ready):
+                entry = cqe[i]
+                index = entry.user_data
+                try:
+                    # Reading res raises OSError for a failed or cancelled request
+                    if entry.res != jobs[index][2].st_size:
+                        failed.add(index)
+                except OSError:
+                    failed.add(index)
+            liburing.io_uring_cq_advance(ring, ready)
+            pending -= ready
+            
+        # Only st_size bytes were read, so a source that grew since it was statted
+        # is copied again by the caller, which reads through to end of file
+        for index, (src, dst, st) in enumerate(jobs):
+            if index not in failed and os.fstat(fds[2 * index]).st_size != st.st_size:
+                failed.add(index)
+    finally:
+        for fd in fds:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+        
+    for index, (src, dst, st) in enumerate(jobs):
+        if index not in failed:
+            _apply_stat(dst, st)
+    return [jobs[index] for index in sorted(failed)]
+
+def _write_file(path, data, mode):
+    """Write bytes to path with raw os calls and give it the given mode"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, mode)
+    try:
+        _write_all(fd, data)
+        # The os.open mode only applies to a new file, and is filtered by the umask
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, mode)
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=32)
+def _validate_installation_path(path):
+    """Validate a canonical installation path, caching the (valid, message) result"""
+    # Creating the directory up front answers "can it be created?" in one step
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError as e:
+        return False, str(e)
+    if not os.access(path, os.W_OK):
+        return False, "No write permission to installation directory"
+    return True, "Path is valid"
 
 class SilentInstaller:
+    # Parsed config files shared across instances: path -> (st_mtime_ns, config dict)
+    _CONFIG_CACHE = {}
+    
     def __init__(self):
         self.app_name = "Minecraft Server Wrapper"
         self.app_version = "1.0.0"
@@ -33,15 +368,46 @@ class SilentInstaller:
             'install_service': True
         }
         
+        # Stat result of the installation directory, taken once by install_files
+        self._install_stat = None
+        
+        # Buffered verbose output, created by run_silent_installation when --verbose is set
+        self._log = None
+        # Per-thread override of _log, used while a step runs on a worker thread
+        self._thread_log = threading.local()
+        
     def get_default_install_path(self):
         """Get the default installation path based on the operating system"""
-        if platform.system() == "Windows":
-            return os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), self.app_name)
-        else:
-            return os.path.join(os.path.expanduser('~'), 'MinecraftWrapper')
+        return _DEFAULT_INSTALL_PATH
             
     def parse_arguments(self):
         """Parse command line arguments for silent installation"""
+        args = types.SimpleNamespace(silent=False, install_path=None, accept_license=False,
+                                     no_service=False, no_shortcuts=False, include_examples=False,
+                                     config_file=None, verbose=False)
+        argv = sys.argv[1:]
+        i = 0
+        while i < len(argv):
+            arg = argv[i]
+            if arg in _FLAGS:
+                setattr(args, _FLAGS[arg], True)
+            else:
+                flag, sep, value = arg.partition('=') if arg.startswith('--') else (arg, '', '')
+                if not sep and flag in _VALUE_FLAGS and i + 1 < len(argv):
+                    i += 1
+                    value = argv[i]
+                if flag not in _VALUE_FLAGS or not value or value.startswith('-'):
+                    # --help, abbreviations, bundled or unknown options and missing
+                    # values are left to argparse, which also reports the errors
+                    return self.parse_arguments_with_argparse()
+                setattr(args, _VALUE_FLAGS[flag], value)
+            i += 1
+        return args
+        
+    def parse_arguments_with_argparse(self):
+        """Parse command line arguments with argparse, for help output and error reporting"""
+        import argparse
+        
         parser = argparse.ArgumentParser(description='Minecraft Server Wrapper Silent Installer')
         
         parser.add_argument('--silent', '-S', action='store_true',
@@ -66,86 +432,87 @@ class SilentInstaller:
     def load_config_file(self, config_file):
         """Load configuration from JSON file"""
         try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
-                self.config.update(file_config)
-                return True
+            # Reparse only when the file has changed since it was last loaded
+            mtime_ns = os.stat(config_file).st_mtime_ns
+            entry = self._CONFIG_CACHE.get(config_file)
+            if entry is None or entry[0] != mtime_ns:
+                with open(config_file, 'rb') as f:
+                    entry = (mtime_ns, _loads(f.read()))
+                self._CONFIG_CACHE[config_file] = entry
+                
+            # Merge a copy so later changes to self.config cannot leak into the cache
+            import copy
+            self.config.update(copy.deepcopy(entry[1]))
+            return True
         except Exception as e:
+            self._flush_log()
             print(f"Error loading config file: {e}")
             return False
             
     def validate_installation_path(self, path):
         """Validate the installation path"""
-        try:
-            # Check if path exists or can be created
-            if not os.path.exists(path):
-                parent = os.path.dirname(path)
-                if not os.path.exists(parent):
-                    return False, "Parent directory does not exist"
-                if not os.access(parent, os.W_OK):
-                    return False, "No write permission to parent directory"
-            elif not os.access(path, os.W_OK):
-                return False, "No write permission to installation directory"
-                
-            return True, "Path is valid"
-        except Exception as e:
-            return False, str(e)
-            
-    def install_files(self, verbose=False):
-        """Install application files"""
-        files_to_copy = [
-            'app.js', 'package.json', 'script.js', 'index.html', 'style.css',
-            'install.bat', 'install.sh', 'setup.js', 'uninstall.bat', 'uninstall.sh',
-            'README.md'
-        ]
+        return _validate_installation_path(os.path.realpath(path))
         
+    def install_files(self):
+        """Install application files"""
         try:
-            # Create installation directory
+            # Validation results are cached, so the directory may have gone since it was checked
             os.makedirs(self.config['install_path'], exist_ok=True)
+            self._install_stat = os.stat(self.config['install_path'])
             
-            copied_files = 0
-            for filename in files_to_copy:
-                if os.path.exists(filename):
-                    if verbose:
-                        print(f"Copying {filename}...")
-                    shutil.copy2(filename, self.config['install_path'])
-                    copied_files += 1
-                elif verbose:
-                    print(f"Warning: {filename} not found, skipping...")
+            # One directory scan yields every source file along with its stat result
+            entries = {entry.name: entry for entry in os.scandir('.')}
+            
+            # Destination paths are the directory prefix plus a plain file name
+            prefix = os.path.join(self.config['install_path'], '')
+            
+            jobs = []
+            for filename in _FILES_TO_COPY:
+                entry = entries.get(filename)
+                if entry is not None and entry.is_file():
+                    self._say(f"Copying {filename}...")
+                    jobs.append((filename, prefix + filename, entry.stat()))
+                else:
+                    self._say(f"Warning: {filename} not found, skipping...")
                     
-            if verbose:
-                print(f"Copied {copied_files} files to {self.config['install_path']}")
+            # Start the largest transfers first so they overlap the tail of small files
+            jobs.sort(key=lambda job: job[2].st_size, reverse=True)
+            _copy_files(jobs, self._install_stat.st_dev)
+            copied_files = len(jobs)
+            
+            self._say(f"Copied {copied_files} files to {self.config['install_path']}")
                 
+            # The installation directory has changed, so earlier validations are stale
+            _validate_installation_path.cache_clear()
             return True, f"Successfully copied {copied_files} files"
         except Exception as e:
             return False, f"Error copying files: {e}"
             
-    def create_shortcuts(self, verbose=False):
+    def create_shortcuts(self):
         """Create desktop shortcuts"""
         if not self.config['create_shortcuts']:
             return True, "Shortcuts creation skipped"
             
         try:
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 # Create Windows shortcut
-                desktop = os.path.join(os.path.expanduser('~'), 'Desktop')
+                desktop = _DESKTOP
                 shortcut_path = os.path.join(desktop, f"{self.app_name}.lnk")
                 
-                # Simple batch file shortcut for Windows
-                batch_content = f"""@echo off
-cd /d "{self.config['install_path']}"
-start.bat
-"""
+                # Simple batch file shortcut for Windows, encoded in the ANSI code page
+                # like the text-mode file it replaces
+                import locale
+                batch_bytes = ("@echo off\r\n"
+                               f"cd /d \"{self.config['install_path']}\"\r\n"
+                               "start.bat\r\n").encode(locale.getpreferredencoding(False))
                 batch_path = os.path.join(desktop, f"{self.app_name}.bat")
-                with open(batch_path, 'w') as f:
-                    f.write(batch_content)
+                _write_file(batch_path, batch_bytes, 0o755)
                     
-                if verbose:
-                    print(f"Created desktop shortcut: {batch_path}")
+                self._say(f"Created desktop shortcut: {batch_path}")
                     
             else:
                 # Create Linux desktop entry
-                desktop = os.path.join(os.path.expanduser('~'), 'Desktop')
+                desktop = _DESKTOP
                 os.makedirs(desktop, exist_ok=True)
                 
                 desktop_entry = f"""[Desktop Entry]
@@ -158,85 +525,128 @@ Type=Application
 Categories=Game;
 """
                 desktop_file = os.path.join(desktop, f"{self.app_name.replace(' ', '_')}.desktop")
-                with open(desktop_file, 'w') as f:
-                    f.write(desktop_entry)
-                    
-                # Make executable
-                os.chmod(desktop_file, 0o755)
+                # Desktop entries are UTF-8 by specification; created executable
+                _write_file(desktop_file, desktop_entry.encode('utf-8'), 0o755)
                 
-                if verbose:
-                    print(f"Created desktop entry: {desktop_file}")
+                self._say(f"Created desktop entry: {desktop_file}")
                     
             return True, "Shortcuts created successfully"
         except Exception as e:
             return False, f"Error creating shortcuts: {e}"
             
-    def install_service(self, verbose=False):
+    def install_service(self):
         """Install system service"""
         if not self.config['install_service']:
             return True, "Service installation skipped"
             
         try:
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 # Copy service installation script
                 service_script = os.path.join(self.config['install_path'], 'install-service.bat')
                 if os.path.exists(service_script):
-                    if verbose:
-                        print("Service installation script available at:", service_script)
-                        print("Run as administrator to install the service")
+                    self._say(f"Service installation script available at: {service_script}")
+                    self._say("Run as administrator to install the service")
                 else:
-                    if verbose:
-                        print("Warning: Service installation script not found")
+                    self._say("Warning: Service installation script not found")
             else:
                 # Copy systemd service file
                 service_script = os.path.join(self.config['install_path'], 'install-service.sh')
                 if os.path.exists(service_script):
-                    if verbose:
-                        print("Service installation script available at:", service_script)
-                        print("Run with sudo to install the service")
+                    self._say(f"Service installation script available at: {service_script}")
+                    self._say("Run with sudo to install the service")
                 else:
-                    if verbose:
-                        print("Warning: Service installation script not found")
+                    self._say("Warning: Service installation script not found")
                         
             return True, "Service installation prepared"
         except Exception as e:
             return False, f"Error preparing service installation: {e}"
             
-    def create_uninstaller(self, verbose=False):
+    def create_uninstaller(self):
         """Create uninstaller"""
         try:
+            # Reuse the stat taken by install_files rather than statting the directory again
+            install_stat = self._install_stat or os.stat(self.config['install_path'])
             uninstall_info = {
                 'app_name': self.app_name,
                 'app_version': self.app_version,
                 'install_path': self.config['install_path'],
                 'installed_components': self.config['components'],
-                'install_date': str(os.path.getctime(self.config['install_path']))
+                'install_date': str(install_stat.st_ctime)
             }
             
             info_file = os.path.join(self.config['install_path'], 'install_info.json')
-            with open(info_file, 'w') as f:
-                json.dump(uninstall_info, f, indent=2)
+            with open(info_file, 'wb') as f:
+                f.write(_dumps(uninstall_info))
                 
-            if verbose:
-                print(f"Created uninstall information: {info_file}")
+            self._say(f"Created uninstall information: {info_file}")
                 
             return True, "Uninstaller created"
         except Exception as e:
             return False, f"Error creating uninstaller: {e}"
             
+    def get_components_summary(self):
+        """Return the comma-separated names of the selected components"""
+        return ', '.join(k for k, v in self.config['components'].items() if v)
+        
+    def _say(self, msg):
+        """Buffer a verbose-mode line; output is written once by _flush_log"""
+        log = getattr(self._thread_log, 'log', self._log)
+        if log is not None:
+            log.write(msg + '\n')
+            
+    def _flush_log(self):
+        """Write all buffered verbose output to stdout in one call"""
+        if self._log is not None and self._log.tell():
+            sys.stdout.write(self._log.getvalue())
+            sys.stdout.flush()
+            self._log.seek(0)
+            self._log.truncate()
+            
+    def _fail(self, *lines):
+        """Report a fatal error immediately, after any verbose output that led to it"""
+        self._flush_log()
+        for line in lines:
+            print(line)
+        return False
+        
+    def _finish_step(self, step_name, success, message):
+        """Report the outcome of a step, returning False if installation must stop"""
+        if not success:
+            return self._fail(f"Error: {step_name} failed - {message}")
+        self._say(f"✓ {message}")
+        self._say("")
+        return True
+        
+    def _run_steps(self, steps):
+        """Run (description, method name) steps in order, stopping at the first failure"""
+        for step_name, method_name in steps:
+            self._say(f"{step_name}...")
+            success, message = getattr(self, method_name)()
+            if not self._finish_step(step_name, success, message):
+                return False
+        return True
+        
+    def _capture_step(self, method_name):
+        """Run a step on a worker thread, returning (success, message, verbose output)"""
+        self._thread_log.log = io.StringIO() if self._log is not None else None
+        try:
+            success, message = getattr(self, method_name)()
+            return success, message, self._thread_log.log
+        finally:
+            del self._thread_log.log
+            
     def run_silent_installation(self, args):
         """Run the complete silent installation"""
-        verbose = args.verbose
+        # Verbose output is collected in memory and written with a single stdout write
+        self._log = io.StringIO() if args.verbose else None
+        
+        self._say(f"Starting silent installation of {self.app_name} v{self.app_version}")
+        self._say("=" * 60)
         
-        if verbose:
-            print(f"Starting silent installation of {self.app_name} v{self.app_version}")
-            print("=" * 60)
-            
         # Load configuration file if provided
         if args.config_file:
             if not self.load_config_file(args.config_file):
-                print("Error: Failed to load configuration file")
-                return False
+                return self._fail("Error: Failed to load configuration file")
                 
         # Apply command line arguments
         if args.install_path:
@@ -252,61 +662,69 @@ Categories=Game;
             
         # Validate license acceptance
         if not self.config['accept_license']:
-            print("Error: License must be accepted for silent installation")
-            print("Use --accept-license or set 'accept_license': true in config file")
-            return False
+            return self._fail("Error: License must be accepted for silent installation",
+                              "Use --accept-license or set 'accept_license': true in config file")
             
         # Validate installation path
         valid, message = self.validate_installation_path(self.config['install_path'])
         if not valid:
-            print(f"Error: Invalid installation path - {message}")
+            return self._fail(f"Error: Invalid installation path - {message}")
+            
+        self._say(f"Installation path: {self.config['install_path']}")
+        self._say(f"Components: {self.get_components_summary()}")
+        self._say("")
+        
+        # Perform installation steps
+        if not self._run_steps(_STEPS):
             return False
             
-        if verbose:
-            print(f"Installation path: {self.config['install_path']}")
-            print(f"Components: {', '.join([k for k, v in self.config['components'].items() if v])}")
-            print()
+        # These steps are independent I/O-bound work, so run them concurrently. Each
+        # one's output is buffered and reported in the usual step order, ending at
+        # the first failed step
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(_PARALLEL_STEPS)) as executor:
+            futures = [executor.submit(self._capture_step, method_name)
+                       for _, method_name in _PARALLEL_STEPS]
+            results = [future.result() for future in futures]
             
-        # Perform installation steps
-        steps = [
-            ("Installing files", self.install_files),
-            ("Creating shortcuts", self.create_shortcuts),
-            ("Preparing service installation", self.install_service),
-            ("Creating uninstaller", self.create_uninstaller)
-        ]
-        
-        for step_name, step_func in steps:
-            if verbose:
-                print(f"{step_name}...")
-                
-            success, message = step_func(verbose)
-            if not success:
-                print(f"Error: {step_name} failed - {message}")
+        for (step_name, _), (success, message, output) in zip(_PARALLEL_STEPS, results):
+            self._say(f"{step_name}...")
+            if output is not None:
+                self._log.write(output.getvalue())
+            if not self._finish_step(step_name, success, message):
                 return False
                 
-            if verbose:
-                print(f"✓ {message}")
-                print()
-                
-        if verbose:
-            print("=" * 60)
-            print(f"Installation completed successfully!")
-            print(f"Application installed to: {self.config['install_path']}")
-            print()
-            print("Next steps:")
-            print("1. Navigate to the installation directory")
-            print("2. Run setup.js for initial configuration")
-            print("3. Start the application using start.bat (Windows) or start.sh (Linux)")
+        if not self._run_steps(_FINAL_STEPS):
+            return False
             
+        self._say("=" * 60)
+        self._say("Installation completed successfully!")
+        self._say(f"Application installed to: {self.config['install_path']}")
+        self._say("")
+        self._say("Next steps:")
+        self._say("1. Navigate to the installation directory")
+        self._say("2. Run setup.js for initial configuration")
+        self._say("3. Start the application using start.bat (Windows) or start.sh (Linux)")
+        self._flush_log()
+        
         return True
 
+def exit_after_install(success):
+    """Exit the process with the installation's status"""
+    if not success:
+        sys.exit(1)
+        
+    # Nothing is left to clean up after a successful install, so skip interpreter teardown
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
 def main():
     installer = SilentInstaller()
     args = installer.parse_arguments()
     
     if args.silent:
-        success = installer.run_silent_installation(args)
-        sys.exit(0 if success else 1)
+        exit_after_install(installer.run_silent_installation(args))
     else:
         print("Silent installer module")
         print("Use --silent flag to run silent installation")